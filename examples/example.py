@@ -1,13 +1,61 @@
+import argparse
+import math
+
+import numpy as np
 import torch
-from torch.utils.data import DataLoader
+import torch.nn.functional as F
 from transformers import AutoImageProcessor, ResNetForImageClassification
 from datasets import load_dataset
-import evaluate
 
 import torchlit
 
 
-def run_real_test():
+def preload_dataset(dataset, device):
+    """Stack the raw uint8 images of a split once and keep them (a few MB) on `device`."""
+    # 32x32 uint8 stays ~3 KB per image; resizing to the model's input size happens
+    # per batch in `make_transform`, so the full-resolution float split never exists
+    images = torch.from_numpy(
+        np.stack([np.asarray(img.convert("RGB")) for img in dataset["img"]])
+    )
+    labels = torch.tensor(dataset["label"])
+    # On CUDA both uploads come from pinned memory and run asynchronously, so the
+    # label copy is queued while the image copy is still in flight
+    pin = device.type == "cuda"
+    if pin:
+        images, labels = images.pin_memory(), labels.pin_memory()
+    images = images.to(device, non_blocking=pin).permute(0, 3, 1, 2)
+    labels = labels.to(device, non_blocking=pin)
+    return images, labels
+
+
+def make_transform(processor, device):
+    """Return a function doing the image processor's resize, crop and normalize on `device`."""
+    size = processor.size.get("shortest_edge") or processor.size["height"]
+    # ConvNext-style processors resize to size / crop_pct, then center crop to size
+    crop_pct = getattr(processor, "crop_pct", None) or 1.0
+    resize_to = int(size / crop_pct)
+    offset = (resize_to - size) // 2
+    mean = torch.tensor(processor.image_mean, device=device).view(1, -1, 1, 1)
+    std = torch.tensor(processor.image_std, device=device).view(1, -1, 1, 1)
+
+    def transform(images):
+        x = images.float().mul_(processor.rescale_factor)
+        x = F.interpolate(x, size=(resize_to, resize_to), mode="bilinear")
+        x = x[:, :, offset : offset + size, offset : offset + size]
+        return (x - mean) / std
+
+    return transform
+
+
+def iterate_batches(images, labels, batch_size: int):
+    """Yield shuffled minibatches by slicing a random permutation of the preloaded tensors."""
+    perm = torch.randperm(len(labels), device=labels.device)
+    for start in range(0, len(perm), batch_size):
+        idx = perm[start : start + batch_size]
+        yield images[idx], labels[idx]
+
+
+def run_real_test(accum_steps: int = 1, log_every: int = 10):
     print("Loading CIFAR-10 Dataset from Hugging Face...")
     dataset = load_dataset(
         "cifar10", split="train[:5%]"
@@ -22,59 +70,107 @@ def run_real_test():
         model_name, num_labels=10, ignore_mismatched_sizes=True
     )
 
-    # Setup Device - explicitly use CPU for testing as requested
-    device = torch.device("cpu")
+    # Setup Device - CUDA when available (enables the compiled and AMP paths), else CPU
+    device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
     model.to(device)
 
-    # Preprocess
-    def transform(example_batch):
-        inputs = processor([x for x in example_batch["img"]], return_tensors="pt")
-        inputs["labels"] = example_batch["label"]
-        return inputs
-
-    dataset.set_transform(transform)
-    dataloader = DataLoader(dataset, batch_size=32, shuffle=True)
+    # channels_last + torch.compile pay off on CUDA; stay eager elsewhere.
+    # reduce-overhead replays CUDA graphs; the shorter last batch records one extra
+    # graph, once. The uncompiled module is still what torchlit inspects for the
+    # architecture.
+    memory_format = torch.contiguous_format
+    train_model = model
+    if device.type == "cuda":
+        memory_format = torch.channels_last
+        model.to(memory_format=memory_format)
+        train_model = torch.compile(model, mode="reduce-overhead")
+
+    # Keep the raw images on the device; resize and normalize each batch there
+    print("Loading dataset onto the device...")
+    images, labels_all = preload_dataset(dataset, device)
+    transform = make_transform(processor, device)
+    batch_size = 32
+    num_batches = math.ceil(len(labels_all) / batch_size)
 
     optimizer = torch.optim.AdamW(model.parameters(), lr=5e-5)
 
-    print(f"Starting real training loop on {device}...")
+    # Mixed precision: autocast on accelerators, loss scaling only needed on CUDA
+    use_amp = device.type in ("cuda", "mps")
+    scaler = torch.amp.GradScaler(device.type, enabled=device.type == "cuda")
+
+    print(
+        f"Starting real training loop on {device} "
+        f"(effective batch size: {batch_size * accum_steps})..."
+    )
 
     # Use torchlit to monitor the real model
     with torchlit.Monitor(
-        exp_name="cifar10_resnet50", model=model, total_steps=len(dataloader) * 9
+        exp_name="cifar10_resnet50", model=model, total_steps=num_batches * 9
     ) as logger:
 
         model.train()
         global_step = 0
 
+        # Running sums stay on the device; only synced to host every `log_every` steps
+        loss_sum = torch.zeros((), device=device)
+        correct_sum = torch.zeros((), device=device)
+        seen = 0
+
         for epoch in range(1, 10):  # Train for 3 quick epochs
 
-            for batch in dataloader:
+            for pixel_values, labels in iterate_batches(images, labels_all, batch_size):
                 global_step += 1
-
-                # Move to device
-                pixel_values = batch["pixel_values"].to(device)
-                labels = batch["labels"].to(device)
+                pixel_values = transform(pixel_values)
+                pixel_values = pixel_values.contiguous(memory_format=memory_format)
 
                 # Forward Pass
-                outputs = model(pixel_values=pixel_values, labels=labels)
-                loss = outputs.loss
-
-                # Backward Pass
-                optimizer.zero_grad()
-                loss.backward()
-                optimizer.step()
-
-                # Calculate Accuracy (on batch for simplicity)
+                with torch.autocast(
+                    device_type=device.type, dtype=torch.float16, enabled=use_amp
+                ):
+                    outputs = train_model(pixel_values=pixel_values, labels=labels)
+                    loss = outputs.loss
+
+                # Backward Pass — only step the optimizer every `accum_steps` batches
+                scaler.scale(loss / accum_steps).backward()
+                if global_step % accum_steps == 0:
+                    scaler.step(optimizer)
+                    scaler.update()
+                    optimizer.zero_grad(set_to_none=True)
+
+                # Accumulate loss and accuracy without forcing a device sync
                 preds = outputs.logits.argmax(-1)
-                acc = (preds == labels).float().mean().item()
+                loss_sum += loss.detach() * labels.size(0)
+                correct_sum += (preds == labels).sum()
+                seen += labels.size(0)
 
                 # Log to Torchlit dynamically!
-                logger.log(
-                    {"loss": loss.item(), "accuracy": acc},
-                    step=global_step,
-                )
+                if global_step % log_every == 0:
+                    logger.log(
+                        {
+                            # Tensors are fine: the monitor syncs them in one transfer
+                            "loss": loss_sum / seen,
+                            "accuracy": correct_sum / seen,
+                        },
+                        step=global_step,
+                    )
+                    loss_sum.zero_()
+                    correct_sum.zero_()
+                    seen = 0
 
 
 if __name__ == "__main__":
-    run_real_test()
+    parser = argparse.ArgumentParser(description="torchlit CIFAR-10 example")
+    parser.add_argument(
+        "--accum-steps",
+        type=int,
+        default=1,
+        help="Number of batches to accumulate gradients over before each optimizer step",
+    )
+    parser.add_argument(
+        "--log-every",
+        type=int,
+        default=10,
+        help="Number of steps to average metrics over before each torchlit log call",
+    )
+    args = parser.parse_args()
+    run_real_test(accum_steps=args.accum_steps, log_every=args.log_every)
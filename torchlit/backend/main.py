@@ -1,14 +1,28 @@
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException
+from fastapi import FastAPI, Request, WebSocket, WebSocketDisconnect, HTTPException
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
+from fastapi.responses import Response
 from fastapi.staticfiles import StaticFiles
-from pydantic import BaseModel
-from typing import Dict, List, Any
+from pydantic import BaseModel, TypeAdapter, ValidationError
+from typing import Dict, Final, List, Any, Optional
 import asyncio
+import json
 import os
 import signal
 from collections import defaultdict, deque
 
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+
+except ImportError:  # orjson is optional (`pip install torchlit-lib[fast]`)
+
+    def _dumps(obj: Any) -> str:
+        return json.dumps(obj, separators=(",", ":"))
+
+
 app = FastAPI(title="torchlit broker")
 
 app.add_middleware(
@@ -19,26 +33,69 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# In-memory storage for metrics. structure:
+# Number of most recent messages kept per experiment and replayed to a newly connected client
+HISTORY_SIZE = 1000
+
+# In-memory storage for metrics, kept as pre-encoded JSON messages. structure:
+# {
+#    "experiment_name": deque([metric_json, metric_json, ...], maxlen=HISTORY_SIZE)
+# }
+experiment_metrics: Dict[str, deque] = defaultdict(lambda: deque(maxlen=HISTORY_SIZE))
+
+# Static model metadata is kept out of the metric stream and sent once per connection. structure:
 # {
-#    "experiment_name": deque([metric_dict, metric_dict, ...], maxlen=1000)
+#    "experiment_name": {"name": ..., "total_params": ..., "architecture": {...}, ...}
 # }
-experiment_metrics: Dict[str, deque] = defaultdict(lambda: deque(maxlen=1000))
+experiment_model_info: Dict[str, Dict[str, Any]] = {}
+# Pre-encoded `{"exp_name": ..., "model_info": {...}}` message for each entry above
+model_info_messages: Dict[str, str] = {}
 
+# Each connection owns a bounded outbound queue drained by its own sender task. structure:
 # {
-#    "experiment_name": [websocket1, websocket2, ...]
+#    "experiment_name": {websocket1: queue1, websocket2: queue2, ...}
 # }
-active_connections: Dict[str, List[WebSocket]] = defaultdict(list)
+active_connections: Dict[str, Dict[WebSocket, asyncio.Queue]] = defaultdict(dict)
+
+# A client that cannot take a message within this many seconds is dropped
+SEND_TIMEOUT = 5.0
+# Stale messages are dropped (oldest first) once a slow client falls this far behind
+CLIENT_QUEUE_SIZE = 2048
 
 # Auto-shutdown state
 training_finished = False
 
 
+def has_active_connections() -> bool:
+    """True if any experiment still has a connected client."""
+    return any(active_connections.values())
+
+
+async def close_connections(connections: Dict[WebSocket, asyncio.Queue]):
+    """Close the given client sockets, ignoring ones that are already gone."""
+    for ws in list(connections):
+        try:
+            await ws.close()
+        except Exception:
+            pass
+
+
+def drop_experiment_data(exp_name: str):
+    """Forget an experiment's metrics and model info."""
+    experiment_metrics.pop(exp_name, None)
+    experiment_model_info.pop(exp_name, None)
+    model_info_messages.pop(exp_name, None)
+
+
+def schedule_shutdown_check(delay: int):
+    """Start the auto-shutdown countdown if training is done and nobody is watching."""
+    if training_finished and not has_active_connections():
+        asyncio.create_task(delayed_shutdown(delay=delay))
+
+
 async def delayed_shutdown(delay: int = 2):
     """Wait for delay, then shut down if conditions are still met."""
     await asyncio.sleep(delay)
-    total_connections = sum(len(conns) for conns in active_connections.values())
-    if training_finished and total_connections == 0:
+    if training_finished and not has_active_connections():
         print(
             "\n⚡ torchlit dashboard auto-shutting down because there are no active connections."
         )
@@ -48,12 +105,45 @@ async def delayed_shutdown(delay: int = 2):
         threading.Thread(target=lambda: os._exit(0), daemon=True).start()
 
 
+def enqueue(queue: asyncio.Queue, message: str):
+    """Queue a message for one client, dropping its oldest pending message if it lags behind."""
+    if queue.full():
+        queue.get_nowait()
+    queue.put_nowait(message)
+
+
+def broadcast(exp_name: str, message: str):
+    """Queue a message for every client of an experiment without waiting on any socket."""
+    for queue in active_connections.get(exp_name, {}).values():
+        enqueue(queue, message)
+
+
+async def send_queued(websocket: WebSocket, queue: asyncio.Queue):
+    """Drain a client's queue; raises once a send fails or exceeds SEND_TIMEOUT."""
+    while True:
+        message = await queue.get()
+        await asyncio.wait_for(websocket.send_text(message), timeout=SEND_TIMEOUT)
+
+
+async def receive_until_disconnect(websocket: WebSocket):
+    """Wait for any messages from client (e.g. ping) until it disconnects."""
+    try:
+        while True:
+            await websocket.receive_text()
+    except WebSocketDisconnect:
+        pass
+
+
 class MetricLog(BaseModel):
     exp_name: str
     step: int
     metrics: Dict[str, Any]
     sys_stats: Dict[str, Any]
-    model_info: Dict[str, Any] = None
+    model_info: Optional[Dict[str, Any]] = None
+
+
+# Batches are parsed and validated straight from the raw body by pydantic-core
+metric_log_batch = TypeAdapter(List[MetricLog])
 
 
 class StatusLog(BaseModel):
@@ -66,38 +156,83 @@ async def update_status(status_log: StatusLog):
     global training_finished
     if status_log.status == "finished":
         training_finished = True
-        total_connections = sum(len(conns) for conns in active_connections.values())
-        if total_connections == 0:
-            # Give user 10 seconds to open browser if they haven't yet
-            asyncio.create_task(delayed_shutdown(delay=10))
+        # Give user 10 seconds to open browser if they haven't yet
+        schedule_shutdown_check(delay=10)
     return {"status": "ok"}
 
 
+def ingest(logs: List[MetricLog]):
+    """Cache metric logs (in step order) and queue them for each experiment's clients."""
+    pending: Dict[str, List[str]] = defaultdict(list)
+
+    for log_data in logs:
+        exp_name = log_data.exp_name
+
+        if log_data.model_info:
+            info = experiment_model_info.setdefault(exp_name, {})
+            info.update(log_data.model_info)
+            model_info_messages[exp_name] = _dumps(
+                {"exp_name": exp_name, "model_info": info}
+            )
+            broadcast(exp_name, model_info_messages[exp_name])
+
+        # Encode once, straight from the model without an intermediate dict; the same
+        # text is cached and sent to every client
+        message = log_data.model_dump_json(exclude={"model_info"})
+
+        # Store in memory cache
+        experiment_metrics[exp_name].append(message)
+        pending[exp_name].append(message)
+
+    # Broadcast to connected clients: one frame per experiment per request, a JSON array
+    # when it carries several points, so a batch takes one queue slot per client
+    for exp_name, messages in pending.items():
+        if len(messages) == 1:
+            broadcast(exp_name, messages[0])
+        else:
+            broadcast(exp_name, "[" + ",".join(messages) + "]")
+
+
 @app.post("/api/log")
 async def log_metrics(log_data: MetricLog):
     """
     Receive metrics from the torchlit python client and broadcast to connected frontends.
     """
-    exp_name = log_data.exp_name
-    data_point = log_data.dict()
-
-    # Store in memory cache
-    experiment_metrics[exp_name].append(data_point)
-
-    # Broadcast to connected clients for this experiment
-    if exp_name in active_connections:
-        dead_connections = []
-        for connection in active_connections[exp_name]:
-            try:
-                await connection.send_json(data_point)
-            except Exception:
-                dead_connections.append(connection)
+    ingest([log_data])
+    return {"status": "ok"}
 
-        # Cleanup dead connections
-        for dead in dead_connections:
-            active_connections[exp_name].remove(dead)
 
-    return {"status": "ok"}
+@app.post(
+    "/api/log/batch",
+    # The body is read raw, so its List[MetricLog] schema is declared by hand
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {
+                    "schema": {
+                        "type": "array",
+                        "items": {"$ref": "#/components/schemas/MetricLog"},
+                    }
+                }
+            },
+        }
+    },
+)
+async def log_metrics_batch(request: Request):
+    """
+    Receive several metric logs in one request, in step order, and broadcast them like /api/log.
+    """
+    body = await request.body()
+    try:
+        # One pass over the bytes instead of json.loads followed by validating the dicts
+        logs = metric_log_batch.validate_json(body)
+    except ValidationError as e:
+        # Locate errors under "body", as FastAPI does for declared body parameters
+        errors = [{**error, "loc": ("body", *error["loc"])} for error in e.errors()]
+        raise RequestValidationError(errors, body=body)
+    ingest(logs)
+    return {"status": "ok", "count": len(logs)}
 
 
 @app.websocket("/ws/stream/{exp_name}")
@@ -107,29 +242,43 @@ async def websocket_endpoint(websocket: WebSocket, exp_name: str):
     On connection, rehydrate with the last N cached metrics.
     """
     await websocket.accept()
-    active_connections[exp_name].append(websocket)
 
-    try:
-        # Rehydrate existing data
-        if exp_name in experiment_metrics and len(experiment_metrics[exp_name]) > 0:
-            # Send all historical metrics
-            for data_point in list(experiment_metrics[exp_name]):
-                await websocket.send_json(data_point)
-
-        # Keep connection alive
-        while True:
-            # Wait for any messages from client (e.g. ping)
-            await websocket.receive_text()
-
-    except WebSocketDisconnect:
-        active_connections[exp_name].remove(websocket)
-        if not active_connections[exp_name]:
+    # Rehydrate by queueing a snapshot of the history ahead of live points; queueing
+    # and registering happen in the same step (no await in between), so points
+    # logged meanwhile are neither missed nor sent twice
+    queue: asyncio.Queue = asyncio.Queue(maxsize=CLIENT_QUEUE_SIZE)
+    if exp_name in model_info_messages:
+        enqueue(queue, model_info_messages[exp_name])
+    if exp_name in experiment_metrics:
+        # The whole history goes out as a single JSON array frame; the messages are
+        # already encoded, so joining them is all it takes
+        enqueue(queue, "[" + ",".join(experiment_metrics[exp_name]) + "]")
+    active_connections[exp_name][websocket] = queue
+
+    # Keep connection alive until the client leaves or stops keeping up
+    receiver = asyncio.create_task(receive_until_disconnect(websocket))
+    sender = asyncio.create_task(send_queued(websocket, queue))
+    done, pending = await asyncio.wait(
+        {receiver, sender}, return_when=asyncio.FIRST_COMPLETED
+    )
+    for task in pending:
+        task.cancel()
+
+    if sender in done and sender.exception() is not None:
+        # Sending failed or timed out: drop the stalled client
+        try:
+            await asyncio.wait_for(websocket.close(), timeout=SEND_TIMEOUT)
+        except Exception:
+            pass
+
+    connections = active_connections.get(exp_name)
+    if connections is not None:
+        connections.pop(websocket, None)
+        if not connections:
             del active_connections[exp_name]
 
-        # Trigger auto-shutdown check if training is done
-        total_connections = sum(len(conns) for conns in active_connections.values())
-        if training_finished and total_connections == 0:
-            asyncio.create_task(delayed_shutdown(delay=2))
+    # Trigger auto-shutdown check if training is done
+    schedule_shutdown_check(delay=2)
 
 
 @app.get("/api/experiments")
@@ -143,17 +292,14 @@ async def clear_all_experiments():
     """Clear all experiment data and drop connections."""
     try:
         # Close all websocket connections
-        for exp_name in list(active_connections.keys()):
-            for ws in list(active_connections[exp_name]):
-                try:
-                    await ws.close()
-                except Exception:
-                    pass
-
-        # Clear in-memory datastores
-        experiment_metrics.clear()
+        for connections in list(active_connections.values()):
+            await close_connections(connections)
         active_connections.clear()
 
+        # Clear datastores
+        for exp_name in list(experiment_metrics.keys() | experiment_model_info.keys()):
+            drop_experiment_data(exp_name)
+
         return {"status": "success"}
     except Exception as e:
         import traceback
@@ -165,17 +311,12 @@ async def clear_all_experiments():
 @app.delete("/api/experiments/{exp_name}")
 async def delete_experiment(exp_name: str):
     """Delete all data for a specific experiment and close its connections"""
-    if exp_name in experiment_metrics:
-        del experiment_metrics[exp_name]
+    drop_experiment_data(exp_name)
 
     # Send close signal to connected clients
-    if exp_name in active_connections:
-        for ws in list(active_connections[exp_name]):
-            try:
-                await ws.close()
-            except Exception:
-                pass
-        del active_connections[exp_name]
+    connections = active_connections.pop(exp_name, None)
+    if connections:
+        await close_connections(connections)
 
     return {"status": "ok", "deleted": exp_name}
 
@@ -189,14 +330,26 @@ if os.path.exists(FRONTEND_ASSETS):
     app.mount("/assets", StaticFiles(directory=FRONTEND_ASSETS), name="assets")
 
 
+def load_index_html() -> Optional[bytes]:
+    """Read the built index.html; None if the frontend has not been built."""
+    index_path = os.path.join(FRONTEND_DIST, "index.html")
+    if not os.path.exists(index_path):
+        return None
+    with open(index_path, "rb") as f:
+        return f.read()
+
+
+# The SPA shell is read once at import and served from memory
+INDEX_HTML: Final[Optional[bytes]] = load_index_html()
+
+
 @app.get("/{full_path:path}")
 async def serve_frontend(full_path: str):
     """Fallback route to serve the React SPA index.html for all non-API paths."""
     # Check if we have the built frontend
-    index_path = os.path.join(FRONTEND_DIST, "index.html")
-    if os.path.exists(index_path):
+    if INDEX_HTML is not None:
         # We explicitly serve index.html and let React handle the client-side routing
-        return FileResponse(index_path)
+        return Response(content=INDEX_HTML, media_type="text/html")
 
     return {
         "error": "Frontend build not found. Run 'npm run build' inside torchlit/frontend"
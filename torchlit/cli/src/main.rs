@@ -308,13 +308,12 @@ fn draw_sparklines(frame: &mut Frame, area: Rect, state: &AppState) {
     for (i, hist) in state.histories.iter().take(n).enumerate() {
         let vals = &hist.values;
         if vals.is_empty() { continue; }
-        let min = vals.iter().cloned().fold(f64::INFINITY, f64::min);
-        let max = vals.iter().cloned().fold(f64::NEG_INFINITY, f64::max);
+        let (min, max) = vals.iter().fold((f64::INFINITY, f64::NEG_INFINITY), |(lo, hi), &v| (lo.min(v), hi.max(v)));
         let range = (max - min).max(1e-9);
         let name_len = (hist.name.len() + 2).min(spark_rows[i].width as usize);
         let spark_width = spark_rows[i].width as usize - name_len;
-        let spark_chars: String = vals.iter().rev().take(spark_width).collect::<Vec<_>>()
-            .into_iter().rev()
+        // Last `spark_width` values, in order, straight off the deque (no reversed copy)
+        let spark_chars: String = vals.iter().skip(vals.len().saturating_sub(spark_width))
             .map(|v| bars[(((v - min) / range) * 7.0).round() as usize].min(bars[7]))
             .collect();
         let line = Line::from(vec![
@@ -355,15 +354,22 @@ fn main() -> io::Result<()> {
     // ── Stdin reader thread (reads from REAL stdin = NDJSON pipe) ─────────────
     thread::spawn(move || {
         let stdin = io::stdin();
+        let mut reader = stdin.lock();
         let mut prev_elapsed = 0.0f64;
         let mut prev_step = 0u64;
 
-        for line in stdin.lock().lines() {
-            let Ok(line) = line else { break };
-            let line = line.trim().to_string();
+        // One line buffer reused for every message; parse straight from the trimmed slice
+        let mut buf = String::new();
+        loop {
+            buf.clear();
+            match reader.read_line(&mut buf) {
+                Ok(0) | Err(_) => break,
+                Ok(_) => {}
+            }
+            let line = buf.trim();
             if line.is_empty() { continue; }
 
-            match serde_json::from_str::<Message>(&line) {
+            match serde_json::from_str::<Message>(line) {
                 Ok(Message::Init { exp_name, model_name, total_params, trainable_params, device, total_steps }) => {
                     let mut s = state_writer.lock().unwrap();
                     s.exp_name = exp_name;
@@ -385,21 +391,20 @@ fn main() -> io::Result<()> {
                     if sps > 0.0 { s.steps_per_sec = sps; }
 
                     if let Value::Object(map) = &metrics {
-                        let new_metrics: Vec<(String, f64)> = map.iter()
+                        // serde_json's Map is a BTreeMap: already sorted by name, no copy + sort
+                        s.latest_metrics = map.iter()
                             .filter_map(|(k, v)| v.as_f64().map(|f| (k.clone(), f)))
                             .collect();
-                        let mut sorted = new_metrics.clone();
-                        sorted.sort_by(|a, b| a.0.cmp(&b.0));
-                        s.latest_metrics = sorted;
 
-                        for (key, val) in new_metrics {
-                            if let Some(h) = s.histories.iter_mut().find(|h| h.name == key) {
-                                h.values.push_back(val);
+                        let AppState { latest_metrics, histories, .. } = &mut *s;
+                        for (key, val) in latest_metrics.iter() {
+                            if let Some(h) = histories.iter_mut().find(|h| h.name == *key) {
+                                h.values.push_back(*val);
                                 if h.values.len() > 80 { h.values.pop_front(); }
                             } else {
                                 let mut h = MetricHistory { name: key.clone(), values: VecDeque::new() };
-                                h.values.push_back(val);
-                                s.histories.push(h);
+                                h.values.push_back(*val);
+                                histories.push(h);
                             }
                         }
                     }
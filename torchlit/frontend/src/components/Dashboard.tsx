@@ -7,6 +7,15 @@ import { ModelExplorer } from './ModelExplorer';
 import { GlobalProgressBar } from './GlobalProgressBar';
 import type { MetricLog, SysStats, ModelInfo } from '../types';
 
+// Append `items` to `current`, keeping only the last `limit` entries; each kept entry is
+// copied once (no spread-then-slice double copy)
+const appendWindowed = <T,>(current: T[], items: T[], limit: number): T[] => {
+    if (items.length >= limit) return items.slice(items.length - limit);
+    const kept = current.slice(Math.max(0, current.length + items.length - limit));
+    kept.push(...items);
+    return kept;
+};
+
 export const Dashboard: React.FC = () => {
     const [isConnected, setIsConnected] = useState<boolean>(false);
     const [experiments, setExperiments] = useState<string[]>([]);
@@ -33,6 +42,61 @@ export const Dashboard: React.FC = () => {
 
     const sockets = useRef<Map<string, WebSocket>>(new Map());
 
+    // Points received since the last animation frame, per experiment. Messages arrive
+    // in bursts (1000 on rehydration, a batch per flush while training), so they are
+    // committed to state once per frame rather than re-rendering for every message
+    const pendingPoints = useRef<Map<string, { points: any[]; stats: SysStats[] }>>(new Map());
+    const pendingFrame = useRef<number | null>(null);
+
+    const flushPendingPoints = () => {
+        pendingFrame.current = null;
+        const batch = pendingPoints.current;
+        pendingPoints.current = new Map();
+        if (batch.size === 0) return;
+
+        setLastUpdate(Date.now());
+
+        setAllMetrics(prev => {
+            const next = { ...prev };
+            batch.forEach(({ points }, exp) => {
+                if (points.length === 0) return;
+                next[exp] = appendWindowed(prev[exp] || [], points, 1000);
+            });
+            return next;
+        });
+
+        // Merge in only keys not seen before; returning `prev` when there are
+        // none keeps the array identity, so React skips the update
+        const batchKeys = new Set<string>();
+        batch.forEach(({ points }) => {
+            points.forEach(point => {
+                for (const key in point) {
+                    if (key !== 'step') batchKeys.add(key);
+                }
+            });
+        });
+        setMetricKeys(prev => {
+            const newKeys = Array.from(batchKeys).filter(key => !prev.includes(key));
+            return newKeys.length > 0 ? [...prev, ...newKeys] : prev;
+        });
+
+        const statsUpdates = Array.from(batch).filter(([, { stats }]) => stats.length > 0);
+        if (statsUpdates.length > 0) {
+            setLatestStats(prev => {
+                const next = { ...prev };
+                statsUpdates.forEach(([exp, { stats }]) => { next[exp] = stats[stats.length - 1]; });
+                return next;
+            });
+            setHistoricalStats(prev => {
+                const next = { ...prev };
+                statsUpdates.forEach(([exp, { stats }]) => {
+                    next[exp] = appendWindowed(prev[exp] || [], stats, 50);
+                });
+                return next;
+            });
+        }
+    };
+
     const isDev = import.meta.env.DEV;
     const API_URL = isDev ? 'http://localhost:8000' : '';
     const WS_URL = isDev ? 'ws://localhost:8000' : (window.location.protocol === 'https:' ? 'wss:' : 'ws:') + '//' + window.location.host;
@@ -74,6 +138,7 @@ export const Dashboard: React.FC = () => {
         try {
             const response = await fetch(`${API_URL}/api/experiments/clear`, { method: 'POST' });
             if (response.ok) {
+                pendingPoints.current.clear();
                 setExperiments([]);
                 setSelectedExps([]);
                 setAllMetrics({});
@@ -119,6 +184,7 @@ export const Dashboard: React.FC = () => {
             if (!selectedExps.includes(exp)) {
                 socket.close();
                 sockets.current.delete(exp);
+                pendingPoints.current.delete(exp);
                 // Clear data for unselected
                 setAllMetrics(prev => {
                     const next = { ...prev };
@@ -149,46 +215,38 @@ export const Dashboard: React.FC = () => {
                 socket.onerror = () => setIsConnected(false);
 
                 socket.onmessage = (event) => {
-                    const data: MetricLog = JSON.parse(event.data);
-
-                    // Update model info if there are actual keys
-                    if (data.model_info && Object.keys(data.model_info).length > 0) {
-                        setModelInfos(prev => ({
-                            ...prev,
-                            [exp]: { ...prev[exp], ...data.model_info }
-                        }));
-                    }
-                    setLastUpdate(Date.now());
-
-                    const flatData = {
-                        step: data.step,
-                        ...data.metrics
-                    };
-
-                    setAllMetrics(prev => {
-                        const currentExpData = prev[exp] || [];
-                        const next = [...currentExpData, flatData];
-                        const windowed = next.length > 1000 ? next.slice(next.length - 1000) : next;
-                        return { ...prev, [exp]: windowed };
-                    });
-
-                    // Extract and merge keys
-                    setMetricKeys(prev => {
-                        const newKeys = Object.keys(data.metrics);
-                        const merged = new Set([...prev, ...newKeys]);
-                        return Array.from(merged);
-                    });
-
-                    if (data.sys_stats) {
-                        setLatestStats(prev => ({ ...prev, [exp]: data.sys_stats }));
-                        setHistoricalStats(prev => {
-                            const history = prev[exp] || [];
-                            const next = [...history, data.sys_stats];
-                            return { ...prev, [exp]: next.length > 50 ? next.slice(next.length - 50) : next };
-                        });
+                    // Replayed history and logged batches arrive as one JSON array frame, single points bare
+                    const parsed: MetricLog | MetricLog[] = JSON.parse(event.data);
+                    const messages = Array.isArray(parsed) ? parsed : [parsed];
+
+                    for (const data of messages) {
+                        // Update model info if there are actual keys
+                        if (data.model_info && Object.keys(data.model_info).length > 0) {
+                            setModelInfos(prev => ({
+                                ...prev,
+                                [exp]: { ...prev[exp], ...data.model_info }
+                            }));
+                        }
+
+                        // Model info arrives as its own message, once per connection
+                        if (!data.metrics) continue;
+
+                        let pending = pendingPoints.current.get(exp);
+                        if (!pending) {
+                            pending = { points: [], stats: [] };
+                            pendingPoints.current.set(exp, pending);
+                        }
+                        pending.points.push({ step: data.step, ...data.metrics });
+                        if (data.sys_stats) pending.stats.push(data.sys_stats);
+
+                        // Frames are paused in background tabs; keep only what the window can show
+                        if (pending.points.length > 2000) pending.points = pending.points.slice(-1000);
+                        if (pending.stats.length > 100) pending.stats = pending.stats.slice(-50);
                     }
 
-                    // The `model_info` update is handled robustly at the beginning of the callback.
+                    if (pendingFrame.current === null) {
+                        pendingFrame.current = requestAnimationFrame(flushPendingPoints);
+                    }
                 };
 
                 sockets.current.set(exp, socket);
@@ -206,33 +264,32 @@ export const Dashboard: React.FC = () => {
         return () => {
             sockets.current.forEach(s => s.close());
             sockets.current.clear();
+            if (pendingFrame.current !== null) cancelAnimationFrame(pendingFrame.current);
+            pendingPoints.current.clear();
         };
     }, []);
 
     // 3. Merged Data for Charts
     const mergedData = React.useMemo(() => {
-        const steps = new Set<number>();
-        Object.values(allMetrics).forEach(data => {
-            data.forEach(d => steps.add(d.step));
-        });
-
-        const sortedSteps = Array.from(steps).sort((a, b) => a - b);
-
-        return sortedSteps.map(step => {
-            const entry: any = { step };
-            selectedExps.forEach(exp => {
-                const expData = allMetrics[exp] || [];
-                const stepData = expData.find(d => d.step === step);
-                if (stepData) {
-                    Object.keys(stepData).forEach(key => {
-                        if (key !== 'step') {
-                            entry[`${key}::${exp}`] = stepData[key];
-                        }
-                    });
+        // Single pass over every point, grouped by step (instead of a find() per step per
+        // experiment); points logged twice for one step are merged into the same row
+        const byStep = new Map<number, any>();
+        selectedExps.forEach(exp => {
+            (allMetrics[exp] || []).forEach(stepData => {
+                let entry = byStep.get(stepData.step);
+                if (!entry) {
+                    entry = { step: stepData.step };
+                    byStep.set(stepData.step, entry);
+                }
+                for (const key in stepData) {
+                    if (key !== 'step') {
+                        entry[`${key}::${exp}`] = stepData[key];
+                    }
                 }
             });
-            return entry;
         });
+
+        return Array.from(byStep.values()).sort((a, b) => a.step - b.step);
     }, [allMetrics, selectedExps]);
 
     // Check training status
@@ -412,7 +469,7 @@ export const Dashboard: React.FC = () => {
                                             selectedExps={selectedExps}
                                             metricKey={key}
                                             smoothing={smoothing}
-                                            onZoom={() => setZoomedChart(key)}
+                                            onZoom={setZoomedChart}
                                             colorIndex={index}
                                         />
                                     ))}
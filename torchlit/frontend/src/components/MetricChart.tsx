@@ -10,6 +10,12 @@ import {
     Legend
 } from 'recharts';
 import { Maximize2, Activity } from 'lucide-react';
+import { lttbIndices } from '../utils/lttb';
+
+// Most points a chart is given per experiment series; beyond this they are LTTB
+// downsampled, since a chart this wide cannot draw more distinctly anyway
+const MAX_POINTS = 500;
+const MAX_POINTS_ZOOMED = 1500;
 
 interface MetricChartProps {
     title: string;
@@ -17,12 +23,12 @@ interface MetricChartProps {
     selectedExps: string[];
     metricKey: string;
     smoothing: number;
-    onZoom?: () => void;
+    onZoom?: (metricKey: string) => void;
     isZoomed?: boolean;
     colorIndex?: number;
 }
 
-export const MetricChart: React.FC<MetricChartProps> = ({
+const MetricChartView: React.FC<MetricChartProps> = ({
     title,
     data,
     selectedExps,
@@ -47,27 +53,50 @@ export const MetricChart: React.FC<MetricChartProps> = ({
     const processedData = React.useMemo(() => {
         if (smoothing === 0) return data;
 
-        const smoothedData = data.map(d => ({ ...d }));
+        // Smoothed rows carry only this chart's series instead of a copy of every metric
+        const keys = selectedExps.map(exp => `${metricKey}::${exp}`);
+        const smoothedKeys = keys.map(key => `${key}_smoothed`);
+        const prevSmoothed: (number | null)[] = keys.map(() => null);
 
-        selectedExps.forEach(exp => {
-            const key = `${metricKey}::${exp}`;
-            let prevSmoothed: number | null = null;
+        return data.map(d => {
+            const row: any = { step: d.step };
+            keys.forEach((key, k) => {
+                const val = d[key];
+                if (val === undefined || val === null) return;
+
+                const prev = prevSmoothed[k];
+                const smoothed = prev === null ? val : prev * smoothing + val * (1 - smoothing);
+                prevSmoothed[k] = smoothed;
+                row[key] = val;
+                row[smoothedKeys[k]] = smoothed;
+            });
+            return row;
+        });
+    }, [data, metricKey, selectedExps, smoothing]);
 
-            for (let i = 0; i < smoothedData.length; i++) {
-                const val = smoothedData[i][key];
-                if (val === undefined || val === null) continue;
+    // Downsample after smoothing so the EMA still sees every point
+    const chartData = React.useMemo(() => {
+        const threshold = isZoomed ? MAX_POINTS_ZOOMED : MAX_POINTS;
+        if (processedData.length <= threshold) return processedData;
 
-                if (prevSmoothed === null) {
-                    prevSmoothed = val;
-                } else {
-                    prevSmoothed = prevSmoothed * smoothing + val * (1 - smoothing);
-                }
-                smoothedData[i][`${key}_smoothed`] = prevSmoothed;
-            }
+        // Keep the union of the rows LTTB picks for each experiment's raw series
+        const keep = new Set<number>();
+        selectedExps.forEach(exp => {
+            const key = `${metricKey}::${exp}`;
+            const rows: number[] = [];
+            processedData.forEach((d, i) => {
+                if (typeof d[key] === 'number') rows.push(i);
+            });
+            const picked = lttbIndices(
+                rows.map(i => processedData[i].step),
+                rows.map(i => processedData[i][key]),
+                threshold
+            );
+            picked.forEach(p => keep.add(rows[p]));
         });
 
-        return smoothedData;
-    }, [data, metricKey, selectedExps, smoothing]);
+        return processedData.filter((_, i) => keep.has(i));
+    }, [processedData, metricKey, selectedExps, isZoomed]);
 
     return (
         <div className={`bg-slate-800/80 backdrop-blur-sm border border-slate-700/50 rounded-2xl shadow-xl transition-all duration-300 ${isZoomed ? 'p-8 h-full flex flex-col' : 'p-5 hover:shadow-2xl'}`}>
@@ -78,7 +107,7 @@ export const MetricChart: React.FC<MetricChartProps> = ({
                 </h3>
                 {!isZoomed && onZoom && (
                     <button
-                        onClick={onZoom}
+                        onClick={() => onZoom(metricKey)}
                         className="p-2 hover:bg-slate-700/50 rounded-lg text-slate-400 hover:text-brand transition-colors"
                         title="Zoom Chart"
                     >
@@ -88,7 +117,7 @@ export const MetricChart: React.FC<MetricChartProps> = ({
             </div>
             <div className={`${isZoomed ? 'flex-1 min-h-0' : 'h-64'} w-full`}>
                 <ResponsiveContainer width="100%" height="100%">
-                    <LineChart data={processedData} margin={{ top: 5, right: 10, left: -20, bottom: 5 }}>
+                    <LineChart data={chartData} margin={{ top: 5, right: 10, left: -20, bottom: 5 }}>
                         <CartesianGrid strokeDasharray="3 3" stroke="#334155" vertical={false} />
                         <XAxis
                             dataKey="step"
@@ -146,7 +175,9 @@ export const MetricChart: React.FC<MetricChartProps> = ({
                                         strokeWidth={isZoomed ? 4 : 2}
                                         dot={false}
                                         activeDot={{ r: 6, strokeWidth: 0, fill: color }}
-                                        animationDuration={300}
+                                        // Data changes every frame while training; animating
+                                        // each update would re-interpolate the whole path
+                                        isAnimationActive={false}
                                     />
                                 </React.Fragment>
                             );
@@ -157,3 +188,7 @@ export const MetricChart: React.FC<MetricChartProps> = ({
         </div>
     );
 };
+
+// Charts only re-render when their own props change, not on every dashboard update
+// (stats ticks, panel toggles, ...); `onZoom` takes the key so callers can pass a stable setter
+export const MetricChart = React.memo(MetricChartView);
@@ -8,11 +8,14 @@ interface SparklineProps {
     color: string;
 }
 
-export const Sparkline: React.FC<SparklineProps> = ({ data, dataKey, color }) => {
-    if (!data || data.length === 0) return null;
+const SparklineView: React.FC<SparklineProps> = ({ data, dataKey, color }) => {
+    // Generate simple array of objects for recharts, only when the stats history changes
+    const chartData = React.useMemo(
+        () => (data || []).map((d, i) => ({ index: i, value: d[dataKey as keyof SysStats] || 0 })),
+        [data, dataKey]
+    );
 
-    // Generate simple array of objects for recharts
-    const chartData = data.map((d, i) => ({ index: i, value: d[dataKey as keyof SysStats] || 0 }));
+    if (chartData.length === 0) return null;
 
     return (
         <div className="absolute -left-2 -right-2 -bottom-2 top-10 opacity-20 pointer-events-none">
@@ -38,3 +41,6 @@ export const Sparkline: React.FC<SparklineProps> = ({ data, dataKey, color }) =>
         </div>
     );
 };
+
+// Stats histories change far less often than the dashboard re-renders
+export const Sparkline = React.memo(SparklineView);
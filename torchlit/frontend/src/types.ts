@@ -12,6 +12,7 @@ export interface ArchitectureNode {
     params: number;
     total_params: number;
     children: ArchitectureNode[];
+    truncated?: number;       // summary node: count of modules left out past max_tree_nodes
 }
 
 export interface ModelInfo {
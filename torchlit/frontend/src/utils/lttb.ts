@@ -0,0 +1,54 @@
+/**
+ * Largest-Triangle-Three-Buckets downsampling.
+ *
+ * Picks `threshold` of the points (xs[i], ys[i]) that best preserve the visual shape of
+ * the series: the first and last points are always kept, and from each bucket in between
+ * the point forming the largest triangle with the previously kept point and the average
+ * of the next bucket. Single pass, O(n).
+ *
+ * Returns the indices of the kept points in ascending order.
+ */
+export function lttbIndices(xs: number[], ys: number[], threshold: number): number[] {
+    const n = xs.length;
+    if (threshold >= n || threshold < 3) {
+        return Array.from({ length: n }, (_, i) => i);
+    }
+
+    const kept: number[] = [0];
+    const bucketSize = (n - 2) / (threshold - 2);
+    let prev = 0;
+
+    for (let bucket = 0; bucket < threshold - 2; bucket++) {
+        // Average of the next bucket is the triangle's third vertex
+        const nextStart = Math.floor((bucket + 1) * bucketSize) + 1;
+        const nextEnd = Math.min(Math.floor((bucket + 2) * bucketSize) + 1, n);
+        let avgX = 0;
+        let avgY = 0;
+        for (let j = nextStart; j < nextEnd; j++) {
+            avgX += xs[j];
+            avgY += ys[j];
+        }
+        avgX /= nextEnd - nextStart;
+        avgY /= nextEnd - nextStart;
+
+        const start = Math.floor(bucket * bucketSize) + 1;
+        const end = Math.floor((bucket + 1) * bucketSize) + 1;
+        let maxArea = -1;
+        let chosen = start;
+        for (let j = start; j < end; j++) {
+            const area = Math.abs(
+                (xs[prev] - avgX) * (ys[j] - ys[prev]) - (xs[prev] - xs[j]) * (avgY - ys[prev])
+            );
+            if (area > maxArea) {
+                maxArea = area;
+                chosen = j;
+            }
+        }
+
+        kept.push(chosen);
+        prev = chosen;
+    }
+
+    kept.push(n - 1);
+    return kept;
+}
@@ -1,17 +1,86 @@
+import collections
+import concurrent.futures
 import contextlib
+import itertools
 import json
 import os
 import platform
 import subprocess
 import threading
 import time
-import requests
-import queue
 import psutil
 import socket
 import sys
 from pathlib import Path
-from typing import Dict, Any, Optional
+from urllib.parse import urlparse
+from typing import TYPE_CHECKING, Dict, List, Tuple, Any, Optional
+
+if TYPE_CHECKING:
+    import requests
+
+
+def _json_default(obj: Any) -> float:
+    """Coerce numeric scalars without a native JSON encoding (e.g. numpy floats)."""
+    try:
+        return float(obj)
+    except (TypeError, ValueError):
+        raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, default=_json_default)
+
+    def _dumps_line(obj: Any) -> bytes:
+        """Serialize `obj` as one newline-terminated NDJSON line."""
+        return orjson.dumps(
+            obj, default=_json_default, option=orjson.OPT_APPEND_NEWLINE
+        )
+
+    def _preencode(obj: Any) -> Any:
+        """Serialize `obj` once so later `_dumps` calls embed the bytes verbatim."""
+        if not hasattr(orjson, "Fragment"):  # orjson < 3.9
+            return obj
+        return orjson.Fragment(_dumps(obj))
+
+except ImportError:  # orjson is optional (`pip install torchlit-lib[fast]`)
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, default=_json_default).encode()
+
+    def _dumps_line(obj: Any) -> bytes:
+        return (json.dumps(obj, default=_json_default) + "\n").encode()
+
+    def _preencode(obj: Any) -> Any:
+        return obj
+
+
+def _encode_batch(payloads: List[Dict[str, Any]]) -> Optional[bytes]:
+    """
+    Encode payloads as one JSON array. A value that cannot be encoded only drops its own
+    payload (model_info moves on to the next one); None if no payload could be encoded.
+    """
+    try:
+        return _dumps(payloads)
+    except (TypeError, ValueError):
+        pass
+
+    model_info = payloads[0].pop("model_info", None)
+    parts = []
+    for payload in payloads:
+        if model_info is not None:
+            payload["model_info"] = model_info
+        try:
+            parts.append(_dumps(payload))
+        except (TypeError, ValueError):
+            payload.pop("model_info", None)
+            continue
+        model_info = None
+    if not parts:
+        return None
+    return b"[" + b",".join(parts) + b"]"
 
 
 def _get_bin_path() -> Path:
@@ -36,6 +105,30 @@ def _get_bin_path() -> Path:
 
 _BIN_PATH = _get_bin_path()
 
+# Metric value types that never need converting (matched by exact type, so a set lookup)
+_PLAIN_NUMBERS = frozenset((float, int))
+
+# Minimum seconds between two psutil / device memory samples
+_SYS_STATS_TTL = 1.0
+
+# Consecutive failed POSTs after which queued steps are dropped instead of sent, and
+# the seconds to wait before probing the server again
+_MAX_SEND_FAILURES = 5
+_SEND_RETRY_COOLDOWN = 30.0
+
+# Max seconds to wait for a freshly spawned dashboard server to accept connections
+_SERVER_START_TIMEOUT = 5.0
+
+# Seconds between flushes of the buffered CLI pipe; matches the TUI's 100 ms redraw poll
+_CLI_FLUSH_INTERVAL = 0.1
+
+
+def _port_open(host: str, port: int, timeout: float = 0.1) -> bool:
+    """Return True if something is accepting TCP connections on host:port."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.settimeout(timeout)
+        return s.connect_ex((host, port)) == 0
+
 
 class Monitor(contextlib.ContextDecorator):
     """
@@ -55,29 +148,47 @@ class Monitor(contextlib.ContextDecorator):
         optimizer: Optional[Any] = None,
         start_server: bool = True,
         total_steps: Optional[int] = None,
+        buffer_size: int = 10000,
+        flush_size: int = 1000,
+        extract_architecture: bool = True,
+        max_tree_nodes: int = 2000,
     ):
         self.exp_name = exp_name
         self.server_url = (
             server_url.rstrip("/") if server_url else "http://localhost:8000"
         )
+        # Parsed once; the server start-up probe only needs host and port
+        parsed_url = urlparse(self.server_url)
+        self._server_host = parsed_url.hostname or "localhost"
+        self._server_port = parsed_url.port or 8000
         self.flush_interval = flush_interval
+        self.flush_size = flush_size
         self.model_info = model_info or {}
         self.model = model
         self.optimizer = optimizer
         self.start_server = start_server
         self.total_steps = total_steps
+        self.extract_architecture = extract_architecture
+        self.max_tree_nodes = max_tree_nodes
 
         if self.total_steps is not None:
             self.model_info["total_steps"] = self.total_steps
 
-        self.queue = queue.Queue()
+        # Single producer (log) / single consumer (worker): deque append/popleft are atomic.
+        # Bounded ring buffer: if the server falls behind, the oldest unsent steps are dropped
+        self.queue: collections.deque = collections.deque(maxlen=buffer_size)
         self.is_running = False
         self.worker_thread: Optional[threading.Thread] = None
+        self._executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        self._stop_event = threading.Event()
+        self._session: Optional["requests.Session"] = None
 
         # Hardware Detection (Cache once)
         self.device_type = "cpu"
         self.device_name = "CPU"
         self._torch = None
+        self._device_index = 0
+        self._vram_total: Optional[int] = None  # queried once, on the first sample
 
         try:
             import torch
@@ -100,6 +211,25 @@ class Monitor(contextlib.ContextDecorator):
         self._cli_proc: Optional[subprocess.Popen] = None
         self._start_time: Optional[float] = None
 
+        # Replaced by requests.RequestException once the session is opened
+        self._request_error: type = OSError
+        self._reset_run_state()
+
+    def _reset_run_state(self):
+        """Initialise the state that must start fresh on every run of a reused Monitor"""
+        self._last_step = 0
+        # A new run may talk to a freshly spawned broker: send model info again
+        self._model_info_sent = False
+        self._model_info_json: Any = None
+        self._sys_stats: Optional[Dict[str, Any]] = None
+        self._sys_stats_time = 0.0
+        self._cpu_percent: Optional[float] = None
+        self._flush_pending = False
+        # Circuit breaker: consecutive failed POSTs and the end of the current cooldown
+        self._send_failures = 0
+        self._retry_at = 0.0
+        self._server_error: Optional[Exception] = None
+
     def _format_num(self, num: int) -> str:
         if num >= 1e9:
             return f"{num / 1e9:.1f} B"
@@ -115,11 +245,13 @@ class Monitor(contextlib.ContextDecorator):
                 "name", self.model.__class__.__name__
             )
 
-            # Count parameters
-            total_params = sum(p.numel() for p in self.model.parameters())
-            trainable_params = sum(
-                p.numel() for p in self.model.parameters() if p.requires_grad
-            )
+            # Count parameters in a single pass
+            total_params = trainable_params = 0
+            for p in self.model.parameters():
+                n = p.numel()
+                total_params += n
+                if p.requires_grad:
+                    trainable_params += n
 
             self.model_info["total_params"] = self.model_info.get(
                 "total_params", self._format_num(total_params)
@@ -134,9 +266,10 @@ class Monitor(contextlib.ContextDecorator):
                 dev_type = first_param.device.type
                 if dev_type == "cuda":
                     self.device_type = "cuda"
+                    self._device_index = first_param.device.index or 0
                     if self._torch and self._torch.cuda.is_available():
                         self.device_name = self._torch.cuda.get_device_name(
-                            first_param.device.index or 0
+                            self._device_index
                         )
                 elif dev_type == "mps":
                     self.device_type = "mps"
@@ -145,63 +278,150 @@ class Monitor(contextlib.ContextDecorator):
                     self.device_type = "cpu"
                     self.device_name = "CPU"
 
-            # Extract architecture tree
+        except Exception:
+            pass
+
+    def _extract_architecture(self):
+        """
+        Build the architecture tree for the dashboard's model explorer. Called lazily on the
+        worker thread right before model_info is first sent, so giant models do not delay
+        training start; capped at `max_tree_nodes` nodes, disabled entirely with
+        `extract_architecture=False`.
+        """
+        if self.model is None or not self.extract_architecture:
+            return
+        if "architecture" in self.model_info:
+            return
+
+        try:
+            # Walk the module graph once: build the tree bottom-up, summing subtree
+            # totals from children instead of re-iterating parameters() per node.
+            # Past max_tree_nodes, remaining children collapse into one summary node
+            seen = set()
+            shared = False
+            visited = []
+            nodes = 0
+
+            def _count_params(modules):
+                nonlocal shared
+                total = 0
+                for p in itertools.chain.from_iterable(m.parameters() for m in modules):
+                    if id(p) in seen:
+                        shared = True
+                        continue
+                    seen.add(id(p))
+                    total += p.numel()
+                return total
+
+            def _truncated_node(modules):
+                omitted = sum(1 for m in modules for _ in m.modules())
+                params = _count_params(modules)
+                node = {
+                    "name": f"... {omitted} more modules",
+                    "class_name": "Truncated",
+                    "params": 0,
+                    "total_params": params,
+                    "children": [],
+                    "truncated": omitted,
+                }
+                visited.append((node, modules))
+                return node
+
             def _get_module_tree(module, name="Root"):
-                children = list(module.named_children())
-                node_params = sum(p.numel() for p in module.parameters(recurse=False))
-                total_node_params = sum(p.numel() for p in module.parameters())
+                nonlocal shared, nodes
+                nodes += 1
+                node_params = 0
+                for p in module.parameters(recurse=False):
+                    node_params += p.numel()
+                    if id(p) in seen:
+                        shared = True
+                    seen.add(id(p))
+
+                children = []
+                omitted = []
+                for child_name, child_module in module.named_children():
+                    if nodes >= self.max_tree_nodes:
+                        omitted.append(child_module)
+                    else:
+                        children.append(_get_module_tree(child_module, child_name))
+                if omitted:
+                    children.append(_truncated_node(omitted))
 
                 node = {
                     "name": name,
                     "class_name": module.__class__.__name__,
                     "params": node_params,
-                    "total_params": total_node_params,
-                    "children": [],
+                    "total_params": node_params
+                    + sum(child["total_params"] for child in children),
+                    "children": children,
                 }
+                visited.append((node, [module]))
+                return node
 
-                for child_name, child_module in children:
-                    node["children"].append(_get_module_tree(child_module, child_name))
+            architecture = _get_module_tree(self.model)
 
-                return node
+            # Shared (tied) parameters would be double counted by the bottom-up sums
+            if shared:
+                for node, modules in visited:
+                    node["total_params"] = sum(
+                        {
+                            id(p): p.numel() for m in modules for p in m.parameters()
+                        }.values()
+                    )
 
-            self.model_info["architecture"] = _get_module_tree(self.model)
+            self.model_info["architecture"] = architecture
 
         except Exception:
             pass
 
     def _start_server_if_needed(self):
-        """Checks if port 8000 is open. If not, spawns the FastAPI server as a detached daemon."""
+        """
+        Checks if the server port is open. If not, schedules the server spawn on the
+        worker thread. The probe and its message stay here, before the CLI takes over
+        the terminal.
+        """
         try:
-            from urllib.parse import urlparse
-
-            port = urlparse(self.server_url).port or 8000
-            host = urlparse(self.server_url).hostname or "localhost"
-
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                s.settimeout(0.1)
-                if s.connect_ex((host, port)) != 0:
-                    print(
-                        f"⚡ torchlit catching up! Spawning dashboard background server at {self.server_url}..."
-                    )
-                    subprocess.Popen(
-                        [
-                            sys.executable,
-                            "-m",
-                            "uvicorn",
-                            "torchlit.backend.main:app",
-                            "--port",
-                            str(port),
-                            "--log-level",
-                            "error",
-                            "--no-access-log",
-                        ],
-                        stdout=subprocess.DEVNULL,
-                        stderr=subprocess.DEVNULL,
-                        start_new_session=True,
-                    )
-                    time.sleep(1.5)
+            if _port_open(self._server_host, self._server_port):
+                return
         except Exception as e:
             print(f"⚠️ torchlit could not start background server: {e}")
+            return
+        print(
+            f"⚡ torchlit catching up! Spawning dashboard background server at {self.server_url}..."
+        )
+        self._executor.submit(self._spawn_server)
+
+    def _spawn_server(self):
+        """
+        Spawns the FastAPI server as a detached daemon and waits until it accepts
+        connections. Runs on the worker thread, so the training loop starts without
+        waiting for the server.
+        """
+        host, port = self._server_host, self._server_port
+        try:
+            subprocess.Popen(
+                [
+                    sys.executable,
+                    "-m",
+                    "uvicorn",
+                    "torchlit.backend.main:app",
+                    "--port",
+                    str(port),
+                    "--log-level",
+                    "error",
+                    "--no-access-log",
+                ],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                start_new_session=True,
+            )
+            # Poll for readiness instead of sleeping a fixed amount
+            deadline = time.monotonic() + _SERVER_START_TIMEOUT
+            while not _port_open(host, port) and time.monotonic() < deadline:
+                time.sleep(0.05)
+        except Exception as e:
+            # The CLI may own the terminal by now; reported once it has exited
+            self._server_error = e
 
     # ─────────────────────────────────────────────────────────────────────────
     # Rust CLI Display
@@ -209,12 +429,23 @@ class Monitor(contextlib.ContextDecorator):
 
     def _write_cli(self, msg: dict) -> None:
         """Write a JSON message line to the Rust CLI process stdin."""
-        if self._cli_proc is not None and self._cli_proc.poll() is None:
+        # Read once: the worker's _flush_cli may reset _cli_proc at any point
+        proc = self._cli_proc
+        if proc is not None:
             try:
-                line = json.dumps(msg) + "\n"
-                self._cli_proc.stdin.write(line.encode())
-                self._cli_proc.stdin.flush()
-            except (BrokenPipeError, OSError):
+                # Buffered: no syscall per step, the worker flushes every
+                # _CLI_FLUSH_INTERVAL; a dead process surfaces as BrokenPipeError
+                proc.stdin.write(_dumps_line(msg))
+            except (BrokenPipeError, OSError, ValueError):
+                self._cli_proc = None
+
+    def _flush_cli(self) -> None:
+        """Push buffered CLI messages down the pipe."""
+        proc = self._cli_proc
+        if proc is not None:
+            try:
+                proc.stdin.flush()
+            except (BrokenPipeError, OSError, ValueError):
                 self._cli_proc = None
 
     def _start_cli(self) -> None:
@@ -226,12 +457,12 @@ class Monitor(contextlib.ContextDecorator):
             self._cli_proc = subprocess.Popen(
                 [str(_BIN_PATH)],
                 stdin=subprocess.PIPE,
+                bufsize=65536,
                 stdout=None,  # inherit terminal
                 stderr=subprocess.DEVNULL,
             )
-            # Give Rust process a moment to initialize before writing
-            time.sleep(0.15)
-            # Send init message
+            # No need to wait for the process to start: the pipe holds the init
+            # message until the CLI's reader thread gets to it
             self._write_cli(
                 {
                     "type": "init",
@@ -243,6 +474,7 @@ class Monitor(contextlib.ContextDecorator):
                     "total_steps": self.total_steps,
                 }
             )
+            self._flush_cli()
         except Exception:
             self._cli_proc = None
 
@@ -263,12 +495,41 @@ class Monitor(contextlib.ContextDecorator):
 
     # ─────────────────────────────────────────────────────────────────────────
 
+    def _open_session(self):
+        """
+        Create the HTTP session. Runs on the executor, so importing requests (the bulk
+        of torchlit's import time) never blocks the training script.
+        """
+        import requests
+
+        self._request_error = requests.RequestException
+        # One keep-alive connection to the server reused for every request of this run
+        session = requests.Session()
+        session.headers["Content-Type"] = "application/json"
+        session.mount(
+            "http://", requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=1)
+        )
+        self._session = session
+
     def __enter__(self):
-        if self.start_server:
-            self._start_server_if_needed()
+        # cpu_percent(interval=None) compares against the previous call and returns a
+        # meaningless 0.0 the first time; prime it so the first real sample is valid
+        psutil.cpu_percent(interval=None)
 
-        self._start_time = time.time()
+        # Monotonic: wall-clock adjustments must not skew elapsed time or steps/s
+        self._start_time = time.monotonic()
         self.is_running = True
+        self._stop_event.clear()
+        self._reset_run_state()
+
+        # All network I/O runs on one executor thread, so batches are sent in step order;
+        # the server start is submitted first and every flush queues up behind it
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="torchlit"
+        )
+        self._executor.submit(self._open_session)
+        if self.start_server:
+            self._start_server_if_needed()
         self.worker_thread = threading.Thread(target=self._worker_loop, daemon=True)
         self.worker_thread.start()
 
@@ -277,17 +538,32 @@ class Monitor(contextlib.ContextDecorator):
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.is_running = False
+        self._stop_event.set()
         if self.worker_thread is not None:
-            self.worker_thread.join(timeout=2.0)
+            self.worker_thread.join()
+        # Waits for a server that is still starting up and any flush in flight
+        self._executor.shutdown(wait=True)
+        self._executor = None
 
-        # Flush remaining queued items
-        self._flush_queue()
+        # Flush remaining queued items; teardown below must run even if this fails
+        try:
+            self._flush_queue()
+        finally:
+            self._teardown()
+        return False
 
+    def _teardown(self):
+        """Stop the CLI, report the run as finished and close the HTTP session"""
         self._stop_cli(final_step=self._last_step)
+        if self._server_error is not None:
+            print(
+                f"⚠️ torchlit could not start background server: {self._server_error}"
+            )
+            self._server_error = None
 
         if self.start_server:
             try:
-                requests.post(
+                self._session.post(
                     f"{self.server_url}/api/status",
                     json={"status": "finished"},
                     timeout=1.0,
@@ -298,19 +574,30 @@ class Monitor(contextlib.ContextDecorator):
                 print(
                     "   (It will automatically shut down when you close the browser window)"
                 )
-            except requests.RequestException:
+            except self._request_error:
                 pass
 
-        return False
-
-    _last_step: int = 0
+        self._session.close()
+        self._session = None
 
     def log(self, metrics: Dict[str, Any], step: int):
-        """Queue metrics for the server and push to the Rust CLI display."""
+        """
+        Queue metrics for the server and push to the Rust CLI display.
+        Values may be numbers or scalar tensors.
+        """
+        # Cast once here; the CLI and the batch payloads reuse the plain int
+        step = int(step)
         self._last_step = step
-        elapsed = time.time() - self._start_time if self._start_time else 0.0
+        start = self._start_time
+        elapsed = time.monotonic() - start if start is not None else 0.0
+        if self._torch is not None:
+            metrics = self._tensors_to_floats(metrics)
 
-        self.queue.put({"step": step, "metrics": metrics})
+        queue = self.queue
+        queue.append((step, metrics))
+        if len(queue) >= self.flush_size:
+            # Bursts go out as soon as a batch is full instead of waiting for the tick
+            self._request_flush()
 
         # Push to Rust TUI
         self._write_cli(
@@ -322,11 +609,54 @@ class Monitor(contextlib.ContextDecorator):
             }
         )
 
+    def _tensors_to_floats(self, metrics: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Replace scalar tensor values with floats, copying all of them to the host in one
+        transfer (a single device sync) instead of one `.item()` per metric.
+        """
+        Tensor = self._torch.Tensor
+        # Plain numbers (the usual case) are skipped with an exact type check, before the
+        # isinstance call that goes through Tensor's metaclass
+        keys = [
+            k
+            for k, v in metrics.items()
+            if type(v) not in _PLAIN_NUMBERS and isinstance(v, Tensor)
+        ]
+        if not keys:
+            return metrics
+
+        # float64 keeps float64 losses and int64 counters beyond 2**24 exact, like
+        # float(t.item()) did; MPS has no float64, so float32 is the widest there
+        torch = self._torch
+        tensors = [metrics[k] for k in keys]
+        dtype = torch.float32 if tensors[0].device.type == "mps" else torch.float64
+        try:
+            values = torch.stack(
+                [t.detach().to(dtype).reshape(()) for t in tensors]
+            ).tolist()
+        except (RuntimeError, TypeError):  # mixed devices (or not scalars)
+            values = [float(metrics[k]) for k in keys]
+        return {**metrics, **dict(zip(keys, values))}
+
     def _get_system_stats(self) -> Dict[str, Any]:
+        """Return system usage metrics, re-sampled at most once per _SYS_STATS_TTL"""
+        now = time.monotonic()
+        if self._sys_stats is None or now - self._sys_stats_time >= _SYS_STATS_TTL:
+            self._sys_stats = self._sample_system_stats()
+            self._sys_stats_time = now
+        return self._sys_stats
+
+    def _sample_system_stats(self) -> Dict[str, Any]:
         """Collect system usage metrics"""
+        vm = psutil.virtual_memory()
+        cpu_percent = self._cpu_percent
+        if cpu_percent is None:
+            # Batches sent before the first flush tick (size-triggered or a short run's
+            # final flush) read it here, measured since the priming call in __enter__
+            cpu_percent = psutil.cpu_percent(interval=None)
         stats = {
-            "cpu_percent": psutil.cpu_percent(interval=None),
-            "ram_percent": psutil.virtual_memory().percent,
+            "cpu_percent": cpu_percent,
+            "ram_percent": vm.percent,
             "device_type": self.device_type,
             "device_name": self.device_name,
             "vram_percent": None,
@@ -335,46 +665,94 @@ class Monitor(contextlib.ContextDecorator):
         if self._torch is not None:
             try:
                 if self.device_type == "cuda":
-                    mem_alloc = self._torch.cuda.memory_allocated(0)
-                    mem_total = self._torch.cuda.get_device_properties(0).total_memory
-                    if mem_total > 0:
-                        stats["vram_percent"] = (mem_alloc / mem_total) * 100
+                    if self._vram_total is None:
+                        self._vram_total = self._torch.cuda.get_device_properties(
+                            self._device_index
+                        ).total_memory
+                    mem_alloc = self._torch.cuda.memory_allocated(self._device_index)
+                    if self._vram_total > 0:
+                        stats["vram_percent"] = (mem_alloc / self._vram_total) * 100
                 elif self.device_type == "mps":
                     alloc = self._torch.mps.current_allocated_memory()
-                    total = psutil.virtual_memory().total
-                    stats["vram_percent"] = (alloc / total) * 100
+                    stats["vram_percent"] = (alloc / vm.total) * 100
             except Exception:
                 pass
 
         return stats
 
     def _worker_loop(self):
-        """Background thread loop to send data"""
-        while self.is_running:
-            self._flush_queue()
-            time.sleep(self.flush_interval)
+        """
+        Background timer that flushes the CLI pipe every _CLI_FLUSH_INTERVAL, and samples
+        CPU usage and schedules a server flush every flush_interval, until stopped
+        """
+        next_flush = time.monotonic() + self.flush_interval
+        while True:
+            # Without an attached CLI there is no pipe to flush: sleep to the next flush
+            timeout = next_flush - time.monotonic()
+            if self._cli_proc is not None:
+                timeout = min(_CLI_FLUSH_INTERVAL, timeout)
+            if self._stop_event.wait(max(timeout, 0.0)):
+                break
+            self._flush_cli()
+            now = time.monotonic()
+            if now >= next_flush:
+                next_flush = now + self.flush_interval
+                # Sampled every flush tick, even with nothing queued, so the reading
+                # covers the last flush_interval rather than the time since the last batch
+                self._cpu_percent = psutil.cpu_percent(interval=None)
+                self._request_flush()
+
+    def _request_flush(self):
+        """Schedule a flush on the executor unless one is already waiting to run"""
+        if self.is_running and not self._flush_pending:
+            self._flush_pending = True
+            self._executor.submit(self._flush_queue)
 
     def _flush_queue(self):
-        """Send all items currently in the queue"""
-        while not self.queue.empty():
-            try:
-                item = self.queue.get_nowait()
-                self._send_data(int(item["step"]), dict(item["metrics"]))
-                self.queue.task_done()
-            except queue.Empty:
-                break
+        """Send all items currently in the queue as a single batch request"""
+        # Cleared before draining: steps logged from here on need another flush
+        self._flush_pending = False
+        if self._retry_at and time.monotonic() < self._retry_at:
+            # Server keeps failing: drop the backlog instead of building payloads for it
+            self.queue.clear()
+            return
 
-    def _send_data(self, step: int, metrics: Dict[str, Any]):
-        """Perform the actual HTTP POST request"""
-        payload = {
-            "exp_name": self.exp_name,
-            "step": step,
-            "metrics": metrics,
-            "sys_stats": self._get_system_stats(),
-            "model_info": self.model_info if step == 1 else {},
-        }
+        # Drain only what is queued right now, so a fast producer cannot keep this loop
+        # (and the HTTP batch) growing; the producer never shrinks the deque, so this
+        # many pops always succeed
+        popleft = self.queue.popleft
+        items = [popleft() for _ in range(len(self.queue))]
+
+        if items:
+            self._send_data(items)
+
+    def _send_data(self, items: List[Tuple[int, Dict[str, Any]]]):
+        """Perform the actual HTTP POST request for a batch of queued (step, metrics) items"""
+        # Fields shared by every payload of the batch are set once in a template
+        template = {"exp_name": self.exp_name, "sys_stats": self._get_system_stats()}
+        payloads = [
+            {**template, "step": step, "metrics": metrics} for step, metrics in items
+        ]
+        if not self._model_info_sent:
+            # The architecture tree can be large; encode it once, not on every retry
+            if self._model_info_json is None:
+                self._extract_architecture()
+                self._model_info_json = _preencode(self.model_info)
+            payloads[0]["model_info"] = self._model_info_json
+
+        data = _encode_batch(payloads)
+        if data is None:
+            return
 
         try:
-            requests.post(f"{self.server_url}/api/log", json=payload, timeout=1.0)
-        except requests.RequestException:
-            pass
+            self._session.post(
+                f"{self.server_url}/api/log/batch", data=data, timeout=1.0
+            )
+            self._model_info_sent = True
+            self._send_failures = 0
+            self._retry_at = 0.0
+        except self._request_error:
+            self._send_failures += 1
+            if self._send_failures >= _MAX_SEND_FAILURES:
+                # Until the cooldown expires; one failed probe after it re-arms it
+                self._retry_at = time.monotonic() + _SEND_RETRY_COOLDOWN